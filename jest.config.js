@@ -3,12 +3,12 @@ export default {
   testEnvironment: 'node',
   extensionsToTreatAsEsm: ['.ts'],
   moduleNameMapper: {
-    '^@domain/(.*)$': '<rootDir>/src/domain/$1',
-    '^@application/(.*)$': '<rootDir>/src/application/$1',
-    '^@infrastructure/(.*)$': '<rootDir>/src/infrastructure/$1',
-    '^@adapters/(.*)$': '<rootDir>/src/adapters/$1',
-    '^@interfaces/(.*)$': '<rootDir>/src/interfaces/$1',
-    '^@shared/(.*)$': '<rootDir>/src/shared/$1',
+    '^@domain/(.*)\\.js$': '<rootDir>/src/domain/$1',
+    '^@application/(.*)\\.js$': '<rootDir>/src/application/$1',
+    '^@infrastructure/(.*)\\.js$': '<rootDir>/src/infrastructure/$1',
+    '^@adapters/(.*)\\.js$': '<rootDir>/src/adapters/$1',
+    '^@interfaces/(.*)\\.js$': '<rootDir>/src/interfaces/$1',
+    '^@shared/(.*)\\.js$': '<rootDir>/src/shared/$1',
     '^(\\.{1,2}/.*)\\.js$': '$1',
   },
   transform: {
@@ -0,0 +1,40 @@
+import { MAX_BATCH_IMAGE_URIS, validateAnnotateRequest } from './AnnotateRequest.js';
+import { VisionFeature } from '@shared/types/index.js';
+
+const imageUris = (count: number): string[] =>
+  Array.from({ length: count }, (_, index) => `gs://bucket/transaction-${index}.jpg`);
+
+describe('validateAnnotateRequest', () => {
+  it('accepts a batch of image URIs with the default features', () => {
+    const request = validateAnnotateRequest({ imageUris: imageUris(MAX_BATCH_IMAGE_URIS) });
+
+    expect(request.imageUris).toHaveLength(MAX_BATCH_IMAGE_URIS);
+    expect(request.features).toEqual([
+      VisionFeature.TEXT_DETECTION,
+      VisionFeature.DOCUMENT_TEXT_DETECTION,
+    ]);
+  });
+
+  it.each([
+    ['an empty batch', { imageUris: [] }],
+    ['a batch over the limit', { imageUris: imageUris(MAX_BATCH_IMAGE_URIS + 1) }],
+    ['a batch with an invalid URI', { imageUris: ['not a uri'] }],
+  ])('rejects %s', (_, body) => {
+    expect(() => validateAnnotateRequest(body)).toThrow('Validation failed');
+  });
+
+  it.each([
+    ['imageUri', { imageUri: 'gs://bucket/transaction.jpg' }],
+    ['imageBase64', { imageBase64: 'aW1hZ2U=' }],
+  ])('rejects imageUris combined with %s', (_, source) => {
+    expect(() => validateAnnotateRequest({ imageUris: imageUris(2), ...source })).toThrow(
+      'imageUris cannot be combined with imageUri or imageBase64',
+    );
+  });
+
+  it('rejects a request without an image source', () => {
+    expect(() => validateAnnotateRequest({})).toThrow(
+      'Either imageUri, imageUris or imageBase64 must be provided',
+    );
+  });
+});
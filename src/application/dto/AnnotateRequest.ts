@@ -1,8 +1,12 @@
 import { z } from 'zod';
 import { VisionFeature } from '@shared/types/index.js';
 
+// Same per-request image limit as the Vision API's batch annotate call
+export const MAX_BATCH_IMAGE_URIS = 16;
+
 export const annotateRequestSchema = z.object({
   imageUri: z.string().url().optional(),
+  imageUris: z.array(z.string().url()).min(1).max(MAX_BATCH_IMAGE_URIS).optional(),
   imageBase64: z.string().optional(),
   features: z
     .array(z.nativeEnum(VisionFeature))
@@ -20,8 +24,13 @@ export const validateAnnotateRequest = (data: unknown): AnnotateRequest => {
   }
 
   // Ensure at least one image source is provided
-  if (!result.data.imageUri && !result.data.imageBase64) {
-    throw new Error('Either imageUri or imageBase64 must be provided');
+  if (!result.data.imageUri && !result.data.imageUris && !result.data.imageBase64) {
+    throw new Error('Either imageUri, imageUris or imageBase64 must be provided');
+  }
+
+  // A batch is answered with per-image results, so it cannot be mixed with a single image
+  if (result.data.imageUris && (result.data.imageUri || result.data.imageBase64)) {
+    throw new Error('imageUris cannot be combined with imageUri or imageBase64');
   }
 
   return result.data;
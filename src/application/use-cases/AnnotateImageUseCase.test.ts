@@ -0,0 +1,99 @@
+import 'reflect-metadata';
+import { AnnotateImageUseCase } from './AnnotateImageUseCase.js';
+import { ParseTransactionUseCase } from './ParseTransactionUseCase.js';
+import { OCRResult } from '@domain/entities/OCRResult.js';
+import { type VisionRepository } from '@domain/repositories/VisionRepository.js';
+import { ExternalServiceError } from '@shared/errors/DomainErrors.js';
+import { VisionFeature } from '@shared/types/index.js';
+import type { Logger } from 'winston';
+
+const logger = { info: () => undefined, error: () => undefined } as unknown as Logger;
+
+class FakeVisionRepository implements VisionRepository {
+  public inFlight = 0;
+  public maxInFlight = 0;
+  public readonly delays = new Map<string, number>();
+  public readonly failures = new Map<string, Error>();
+
+  public async annotateImage(imageUri: string, features: VisionFeature[]): Promise<OCRResult> {
+    this.inFlight += 1;
+    this.maxInFlight = Math.max(this.maxInFlight, this.inFlight);
+    await new Promise((resolve) => setTimeout(resolve, this.delays.get(imageUri) ?? 0));
+    this.inFlight -= 1;
+
+    const failure = this.failures.get(imageUri);
+    if (failure) {
+      throw failure;
+    }
+
+    return OCRResult.create({
+      imageUri,
+      features,
+      annotations: {
+        textAnnotations: [{ description: 'Compraste $5.000 en TIENDA con tu *1234' }],
+      },
+    });
+  }
+
+  public annotateImageBuffer(): Promise<OCRResult> {
+    return Promise.reject(new Error('Not used in these tests'));
+  }
+}
+
+const imageUris = (count: number): string[] =>
+  Array.from({ length: count }, (_, index) => `gs://bucket/transaction-${index}.jpg`);
+
+describe('AnnotateImageUseCase', () => {
+  describe('executeFromUris', () => {
+    let visionRepository: FakeVisionRepository;
+    let useCase: AnnotateImageUseCase;
+
+    beforeEach(() => {
+      visionRepository = new FakeVisionRepository();
+      useCase = new AnnotateImageUseCase(
+        visionRepository,
+        logger,
+        new ParseTransactionUseCase(logger),
+      );
+    });
+
+    it('annotates at most four images at a time and keeps the request order', async () => {
+      const uris = imageUris(10);
+      // Earlier images finish last so completion order differs from request order
+      uris.forEach((uri, index) => visionRepository.delays.set(uri, 20 - index * 2));
+
+      const items = await useCase.executeFromUris(uris, [VisionFeature.TEXT_DETECTION]);
+
+      expect(visionRepository.maxInFlight).toBe(4);
+      expect(items.map((item) => item.imageUri)).toEqual(uris);
+      expect(items.map((item) => item.result?.ocrResult.imageUri)).toEqual(uris);
+    });
+
+    it('reports a failed image in its own item without failing the others', async () => {
+      const uris = imageUris(3);
+      visionRepository.failures.set(
+        uris[1] ?? '',
+        new ExternalServiceError('Failed to process image with Vision API'),
+      );
+
+      const items = await useCase.executeFromUris(uris, [VisionFeature.TEXT_DETECTION]);
+
+      expect(items.map((item) => [item.imageUri, item.error])).toEqual([
+        [uris[0], undefined],
+        [uris[1], 'Failed to process image with Vision API'],
+        [uris[2], undefined],
+      ]);
+      expect(items[1]?.result).toBeUndefined();
+      expect(items[2]?.result?.transaction.amounts).toHaveLength(1);
+    });
+
+    it('hides the message of an unexpected error', async () => {
+      const uris = imageUris(1);
+      visionRepository.failures.set(uris[0] ?? '', new Error('connect ECONNREFUSED 10.0.0.7:443'));
+
+      const items = await useCase.executeFromUris(uris, [VisionFeature.TEXT_DETECTION]);
+
+      expect(items[0]?.error).toBe('An unexpected error occurred');
+    });
+  });
+});
@@ -5,6 +5,7 @@ import { BankTransaction } from '@domain/entities/BankTransaction.js';
 import { TransactionValidation } from '@domain/entities/TransactionValidation.js';
 import { OCRResult } from '@domain/entities/OCRResult.js';
 import { VisionFeature } from '@shared/types/index.js';
+import { BaseError } from '@shared/errors/BaseError.js';
 import { type Logger } from 'winston';
 
 export interface AnnotateImageResult {
@@ -13,6 +14,14 @@ export interface AnnotateImageResult {
   validation: TransactionValidation;
 }
 
+export interface AnnotateImageBatchItem {
+  imageUri: string;
+  result?: AnnotateImageResult;
+  error?: string;
+}
+
+const MAX_CONCURRENT_ANNOTATIONS = 4;
+
 @injectable()
 export class AnnotateImageUseCase {
   constructor(
@@ -39,6 +48,26 @@ export class AnnotateImageUseCase {
     };
   }
 
+  public async executeFromUris(
+    imageUris: string[],
+    features: VisionFeature[],
+  ): Promise<AnnotateImageBatchItem[]> {
+    this.logger.info('Annotating images from URIs', { imageCount: imageUris.length, features });
+
+    const items: AnnotateImageBatchItem[] = [];
+
+    // Bounded chunks keep a large batch within the Vision API quota
+    for (let start = 0; start < imageUris.length; start += MAX_CONCURRENT_ANNOTATIONS) {
+      const chunk = imageUris.slice(start, start + MAX_CONCURRENT_ANNOTATIONS);
+      const chunkItems = await Promise.all(
+        chunk.map((imageUri) => this.executeBatchItem(imageUri, features)),
+      );
+      items.push(...chunkItems);
+    }
+
+    return items;
+  }
+
   public async executeFromBuffer(
     imageBuffer: Buffer,
     features: VisionFeature[],
@@ -57,4 +86,22 @@ export class AnnotateImageUseCase {
       validation,
     };
   }
+
+  // A failed image is reported in its own item instead of rejecting the whole batch. Like the
+  // error handler, only operational (BaseError) messages reach the client
+  private async executeBatchItem(
+    imageUri: string,
+    features: VisionFeature[],
+  ): Promise<AnnotateImageBatchItem> {
+    try {
+      const result = await this.executeFromUri(imageUri, features);
+      return { imageUri, result };
+    } catch (error) {
+      this.logger.error('Failed to annotate image in batch', { imageUri, error });
+      return {
+        imageUri,
+        error: error instanceof BaseError ? error.message : 'An unexpected error occurred',
+      };
+    }
+  }
 }
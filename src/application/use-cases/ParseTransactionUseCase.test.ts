@@ -0,0 +1,115 @@
+import 'reflect-metadata';
+import { ParseTransactionUseCase } from './ParseTransactionUseCase.js';
+import { OCRResult } from '@domain/entities/OCRResult.js';
+import { Currency, VisionFeature } from '@shared/types/index.js';
+import type { Logger } from 'winston';
+
+const logger = { info: () => undefined } as unknown as Logger;
+
+const parse = (text: string, logos: string[]): ReturnType<ParseTransactionUseCase['execute']> => {
+  const ocrResult = OCRResult.create({
+    imageUri: 'gs://bucket/receipt.jpg',
+    features: [VisionFeature.TEXT_DETECTION, VisionFeature.LOGO_DETECTION],
+    annotations: {
+      textAnnotations: [{ description: text }],
+      logoAnnotations: logos.map((description) => ({ description })),
+    },
+  });
+  return new ParseTransactionUseCase(logger).execute(ocrResult);
+};
+
+describe('ParseTransactionUseCase', () => {
+  describe('dollar-sign amounts', () => {
+    it.each([
+      ['$1.000', 1000],
+      ['$1,000', 1],
+      ['$1,000.50', 1000.5],
+      ['$1.000.000', 1000000],
+      ['$54.900,00', 54900],
+      ['$12.50', 12.5],
+    ])('parses %p from a Colombian bank as COP %p', (amount, expected) => {
+      const { transaction } = parse(`Compraste ${amount} en TIENDA con tu T.Deb *1234`, [
+        'Bancolombia',
+      ]);
+
+      expect(transaction.amounts.map((a) => [a.value, a.currency])).toEqual([
+        [expected, Currency.COP],
+      ]);
+    });
+
+    it.each([
+      ['$1,234', 1234],
+      ['$1.234', 1.234],
+      ['$3.999', 3.999],
+      ['$0.999', 0.999],
+      ['$1,234.56', 1234.56],
+      ['$1.000.000', 1000000],
+      ['$1.000,50', 1000.5],
+      ['$12.50', 12.5],
+    ])('parses %p from a US bank as USD %p', (amount, expected) => {
+      const { transaction } = parse(`Purchase of ${amount} at STORE with card *1234`, ['Chase']);
+
+      expect(transaction.amounts.map((a) => [a.value, a.currency])).toEqual([
+        [expected, Currency.USD],
+      ]);
+    });
+  });
+
+  describe('time', () => {
+    it.each([
+      ['Pagaste $5.000 a las 9:05 PM', '9:05 PM'],
+      ['Compraste $5.000 a las 14:305', '14:30'],
+    ])('extracts the time from %p as %p', (text, expected) => {
+      expect(parse(text, ['Bancolombia']).transaction.time).toBe(expected);
+    });
+
+    it.each([
+      ['a' + ' '.repeat(20000) + 'las' + ' '.repeat(20000), undefined],
+      ['a las' + ' '.repeat(20000) + '14:30', '14:30'],
+    ])('stays linear on long whitespace runs (case %#)', (text, expected) => {
+      const start = performance.now();
+      const { transaction } = parse(text, []);
+      const elapsed = performance.now() - start;
+
+      expect(transaction.time).toBe(expected);
+      expect(elapsed).toBeLessThan(100);
+    });
+  });
+
+  describe('duplicate amounts', () => {
+    it('keeps a total printed twice only once', () => {
+      const { transaction } = parse('Subtotal $50.000\nTotal $50.000', ['Bancolombia']);
+
+      expect(transaction.amounts.map((a) => [a.value, a.currency])).toEqual([
+        [50000, Currency.COP],
+      ]);
+    });
+
+    it('keeps the explicit COP amount over an equal dollar-sign amount', () => {
+      const { transaction } = parse('Valor $2.000\nAbono $1.000\nTotal COP 1.000', [
+        'Bancolombia',
+      ]);
+
+      expect(transaction.amounts.map((a) => [a.value, a.currency])).toEqual([
+        [1000, Currency.COP],
+        [2000, Currency.COP],
+      ]);
+    });
+
+    it('keeps equal values in different currencies', () => {
+      const { transaction } = parse('Paid $1,000 (COP 1.000)', ['Chase']);
+
+      expect(transaction.amounts.map((a) => [a.value, a.currency])).toEqual([
+        [1000, Currency.COP],
+        [1000, Currency.USD],
+      ]);
+    });
+
+    it('does not warn about multiple amounts when they are all the same', () => {
+      const { transaction, validation } = parse('Pagaste $5.000 '.repeat(6), ['Bancolombia']);
+
+      expect(transaction.amounts).toHaveLength(1);
+      expect(validation.warnings.filter((w) => w.startsWith('Multiple amounts'))).toEqual([]);
+    });
+  });
+});
@@ -21,6 +21,145 @@ const COLOMBIAN_BANKS = new Set([
   'itaú',
 ]);
 
+function escapeRegExp(value: string): string {
+  return value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+// Colombian format: period for thousands, comma for decimals
+function parseColombianNumber(value: string): number {
+  return parseFloat(value.replace(/\./g, '').replace(',', '.'));
+}
+
+// US format: comma for thousands, period for decimals
+function parseUsNumber(value: string): number {
+  return parseFloat(value.replace(/,/g, ''));
+}
+
+// Digit groups of the integer part, and the cents when the last group has only one or two digits
+const NUMBER_PARTS_PATTERN = /^(\d+(?:[.,]\d{3})*)(?:[.,](\d{1,2}))?$/;
+
+// "$" amounts: the separator before trailing cents is the decimal point and separators between
+// three-digit groups group thousands. A single separator before three digits could be either, so
+// the bank's decimal separator decides
+function parseGroupedNumber(value: string, decimalSeparator: ',' | '.'): number {
+  const parts = NUMBER_PARTS_PATTERN.exec(value);
+  if (!parts) {
+    return NaN;
+  }
+
+  const integerPart = parts[1] ?? '';
+  const cents = parts[2];
+  if (cents === undefined && integerPart.replace(/\d/g, '') === decimalSeparator) {
+    return parseFloat(integerPart.replace(decimalSeparator, '.'));
+  }
+
+  const integerDigits = integerPart.replace(/[.,]/g, '');
+  return parseFloat(cents === undefined ? integerDigits : `${integerDigits}.${cents}`);
+}
+
+const COMMON_BANKS = [
+  'Bancolombia',
+  'Davivienda',
+  'BBVA Colombia',
+  'Banco de Bogotá',
+  'Banco de Occidente',
+  'Banco Popular',
+  'Banco AV Villas',
+  'Banco Caja Social',
+  'Bancoomeva',
+  'Colpatria',
+  'Itaú',
+  'Chase',
+  'Bank of America',
+  'Wells Fargo',
+  'Citibank',
+  'Capital One',
+  'US Bank',
+  'PNC',
+  'TD Bank',
+  'Truist',
+  'Fifth Third',
+  'Santander',
+];
+
+const BANKS_BY_LOWERCASE_NAME = new Map(COMMON_BANKS.map((bank) => [bank.toLowerCase(), bank]));
+
+// Zero-width lookahead so overlapping mentions (e.g. "US Bank of America") are all reported,
+// matching the previous per-bank substring checks
+const BANK_NAME_PATTERN = new RegExp(`(?=(${COMMON_BANKS.map(escapeRegExp).join('|')}))`, 'gi');
+
+// Explicit COP, explicit USD and dollar-sign amounts, matched in a single pass over the text
+const CURRENCY_AMOUNT_PATTERN =
+  /COP\s*(?<cop>\d{1,3}(?:\.\d{3})*(?:,\d{2})?)|USD\s*(?<usd>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)|\$\s*(?<dollar>\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})?)/gi;
+const GENERAL_COP_AMOUNT_PATTERN = /(\d{1,3}(?:\.\d{3})+(?:,\d{2})?)/g;
+
+const DATE_PATTERNS = [
+  /\d{1,2}\/\d{1,2}\/\d{2,4}/g,
+  /\d{4}-\d{2}-\d{2}/g,
+  /(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}/gi,
+];
+
+// Merchant and card patterns are single alternations whose named groups are listed in priority
+// order in the accompanying *_GROUP_NAMES (see findHighestPriorityMatch). Their alternatives
+// cannot overlap, so they may consume; a list whose alternatives can overlap must be wrapped in a
+// zero-width lookahead like TRANSACTION_TYPE_PATTERN
+
+// "a las" times are searched only when no plain time is found. They stay a separate search
+// because a lookbehind over the unbounded "a\s+las\s+" prefix is re-run at every position,
+// which is quadratic on long whitespace runs
+const TIME_PATTERN = /\b(?<hour>[0-2]?\d):(?<minute>[0-5]\d)\s*(?<meridiem>AM|PM|am|pm)?\b/;
+const SPANISH_TIME_PATTERN = /a\s+las\s+(?<hour>[0-2]?\d):(?<minute>[0-5]\d)/;
+
+// The merchant, reference and account patterns avoid adjacent quantifiers that can match the
+// same characters, so backtracking stays linear on long whitespace or asterisk runs in OCR text
+const MERCHANT_PATTERN =
+  /en\s+(?<spanish>[A-Z][A-Z\s]*?[A-Z]|[A-Z]\s)\s+con\s|at\s+(?<english>[A-Z][A-Z\s]+?)(?:\s|$)|@\s*(?<atSign>[A-Z][A-Z\s]+?)(?:\s|$)/g;
+const MERCHANT_GROUP_NAMES = ['spanish', 'english', 'atSign'];
+
+const CARD_INFO_PATTERN =
+  /(?<spanishType>T\.Cred|T\.Deb|Tarjeta)\s*\*(?<spanishLast4>\d{4})|(?<englishType>Credit|Debit|Card)\s*\*(?<englishLast4>\d{4})|\*(?<last4>\d{4})/gi;
+const CARD_INFO_GROUP_NAMES = ['spanishLast4', 'englishLast4', 'last4'];
+
+const REFERENCE_NUMBER_PATTERNS = [
+  /(?:REF|REFERENCE|CONFIRMATION|TRANSACTION)\s*(?:(?:NO|NUMBER|#):?\s*|:\s*)?([A-Z0-9-]+)/gi,
+  /\b[A-Z]{2,}\d{6,}\b/g,
+];
+
+// Listed in priority order: when several types are mentioned, the first wins
+const TRANSACTION_TYPE_GROUPS: ReadonlyArray<
+  readonly [groupName: string, type: TransactionType, keywords: readonly string[]]
+> = [
+  ['purchase', TransactionType.PURCHASE, ['compraste', 'compra', 'purchase']],
+  [
+    'wireTransfer',
+    TransactionType.WIRE_TRANSFER,
+    ['transferiste', 'transferencia', 'wire transfer', 'wire'],
+  ],
+  [
+    'withdrawal',
+    TransactionType.WITHDRAWAL,
+    ['retiraste', 'retiro', 'withdrawal', 'withdraw', 'atm'],
+  ],
+  ['deposit', TransactionType.DEPOSIT, ['depositaste', 'depósito', 'deposit', 'deposited']],
+  ['payment', TransactionType.PAYMENT, ['pagaste', 'pago', 'payment', 'paid']],
+  ['achTransfer', TransactionType.ACH_TRANSFER, ['ach', 'electronic transfer']],
+];
+const TRANSACTION_TYPE_GROUP_NAMES = TRANSACTION_TYPE_GROUPS.map(([groupName]) => groupName);
+
+// Keywords overlap ("electronic transfer" / "transferencia", "paid" / "deposit"), so the
+// alternation sits in a zero-width lookahead and is tried at every position without consuming
+const TRANSACTION_TYPE_PATTERN = new RegExp(
+  `(?=${TRANSACTION_TYPE_GROUPS.map(
+    ([groupName, , keywords]) => `(?<${groupName}>${keywords.map(escapeRegExp).join('|')})`,
+  ).join('|')})`,
+  'gi',
+);
+
+const ACCOUNT_NUMBER_PATTERNS = [
+  /(?<!\*)\*{4,}(\d{4})/g,
+  /(?:ACCOUNT|ACCT)\s*(?:(?:NO|NUMBER|#):?\s*|:\s*)?\**(\d{4})/gi,
+];
+
 @injectable()
 export class ParseTransactionUseCase {
   constructor(@inject('Logger') private readonly logger: Logger) {}
@@ -39,7 +178,8 @@ export class ParseTransactionUseCase {
       banksDetected: banks.length,
     });
 
-    const amounts = this.extractAmounts(fullText, banks);
+    const isColombianBank = banks.some((bank) => COLOMBIAN_BANKS.has(bank.toLowerCase()));
+    const amounts = this.extractAmounts(fullText, isColombianBank);
     const dates = this.extractDates(fullText);
     const time = this.extractTime(fullText);
     const merchant = this.extractMerchant(fullText);
@@ -75,86 +215,55 @@ export class ParseTransactionUseCase {
     return { transaction, validation };
   }
 
-  private extractAmounts(text: string, banks: string[]): Amount[] {
-    const amounts: Amount[] = [];
-    const isColombianBank = banks.some((bank) => COLOMBIAN_BANKS.has(bank.toLowerCase()));
-
-    // Priority 1: Explicit COP format
-    const copPattern = /COP\s*(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)/gi;
-    const copMatches = text.matchAll(copPattern);
-    for (const match of copMatches) {
-      try {
-        const amountStr = match[1]?.replace(/\./g, '').replace(',', '.') ?? '';
-        const value = parseFloat(amountStr);
-        if (!isNaN(value)) {
-          amounts.push(Amount.create(value, Currency.COP));
-        }
-      } catch {
-        continue;
-      }
+  private extractAmounts(text: string, isColombianBank: boolean): Amount[] {
+    if (!text) {
+      return [];
     }
 
-    // Priority 2: Explicit USD format
-    const usdPattern = /USD\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/gi;
-    const usdMatches = text.matchAll(usdPattern);
-    for (const match of usdMatches) {
-      try {
-        const amountStr = match[1]?.replace(/,/g, '') ?? '';
-        const value = parseFloat(amountStr);
-        if (!isNaN(value)) {
-          amounts.push(Amount.create(value, Currency.USD));
-        }
-      } catch {
-        continue;
-      }
-    }
+    const copAmounts: Amount[] = [];
+    const usdAmounts: Amount[] = [];
+    const dollarAmounts: Amount[] = [];
+
+    for (const match of text.matchAll(CURRENCY_AMOUNT_PATTERN)) {
+      const groups = match.groups ?? {};
+      const cop = groups['cop'];
+      const usd = groups['usd'];
+      const dollar = groups['dollar'];
 
-    // Priority 3: Dollar sign ($)
-    const dollarPattern = /\$\s*(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})?)/g;
-    const dollarMatches = text.matchAll(dollarPattern);
-    for (const match of dollarMatches) {
       try {
-        const matchStr = match[1] ?? '';
-        let value: number;
-        let currency: Currency;
-
-        if (isColombianBank) {
-          // Colombian format
-          if (matchStr.includes('.') && matchStr.includes(',')) {
-            value = parseFloat(matchStr.replace(/\./g, '').replace(',', '.'));
-          } else if (matchStr.includes('.')) {
-            const parts = matchStr.split('.');
-            if (parts.length > 0 && parts[parts.length - 1]?.length === 3) {
-              value = parseFloat(matchStr.replace(/\./g, ''));
-            } else {
-              value = parseFloat(matchStr);
-            }
-          } else {
-            value = parseFloat(matchStr.replace(',', '.'));
+        if (cop !== undefined) {
+          // Priority 1: Explicit COP format
+          const value = parseColombianNumber(cop);
+          if (!isNaN(value)) {
+            copAmounts.push(Amount.create(value, Currency.COP));
+          }
+        } else if (usd !== undefined) {
+          // Priority 2: Explicit USD format
+          const value = parseUsNumber(usd);
+          if (!isNaN(value)) {
+            usdAmounts.push(Amount.create(value, Currency.USD));
+          }
+        } else if (dollar !== undefined) {
+          // Priority 3: Dollar sign ($), currency and decimal separator taken from the detected bank
+          const value = parseGroupedNumber(dollar, isColombianBank ? ',' : '.');
+          if (!isNaN(value)) {
+            const currency = isColombianBank ? Currency.COP : Currency.USD;
+            dollarAmounts.push(Amount.create(value, currency));
           }
-          currency = Currency.COP;
-        } else {
-          // US format
-          value = parseFloat(matchStr.replace(/,/g, ''));
-          currency = Currency.USD;
-        }
-
-        if (!isNaN(value)) {
-          amounts.push(Amount.create(value, currency));
         }
       } catch {
         continue;
       }
     }
 
+    const amounts = [...copAmounts, ...usdAmounts, ...dollarAmounts];
+
     // Priority 4: Colombian format without currency prefix
     if (amounts.length === 0) {
-      const generalCopPattern = /(\d{1,3}(?:\.\d{3})+(?:,\d{2})?)/g;
-      const matches = text.matchAll(generalCopPattern);
+      const matches = text.matchAll(GENERAL_COP_AMOUNT_PATTERN);
       for (const match of matches) {
         try {
-          const amountStr = match[1]?.replace(/\./g, '').replace(',', '.') ?? '';
-          const value = parseFloat(amountStr);
+          const value = parseColombianNumber(match[1] ?? '');
           if (!isNaN(value)) {
             const currency = isColombianBank ? Currency.COP : Currency.UNKNOWN;
             amounts.push(Amount.create(value, currency));
@@ -165,18 +274,30 @@ export class ParseTransactionUseCase {
       }
     }
 
-    return amounts;
+    return this.removeDuplicateAmounts(amounts);
+  }
+
+  // Keeps the first of each currency and value to the cent, e.g. a total printed twice
+  private removeDuplicateAmounts(amounts: Amount[]): Amount[] {
+    const seen = new Set<string>();
+    return amounts.filter((amount) => {
+      const key = `${amount.currency}:${amount.value.toFixed(2)}`;
+      if (seen.has(key)) {
+        return false;
+      }
+      seen.add(key);
+      return true;
+    });
   }
 
   private extractDates(text: string): string[] {
+    if (!text) {
+      return [];
+    }
+
     const dates: string[] = [];
-    const patterns = [
-      /\d{1,2}\/\d{1,2}\/\d{2,4}/g,
-      /\d{4}-\d{2}-\d{2}/g,
-      /(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}/gi,
-    ];
 
-    for (const pattern of patterns) {
+    for (const pattern of DATE_PATTERNS) {
       const matches = text.matchAll(pattern);
       for (const match of matches) {
         dates.push(match[0] ?? '');
@@ -187,80 +308,66 @@ export class ParseTransactionUseCase {
   }
 
   private extractTime(text: string): string | undefined {
-    const patterns = [
-      /\b([0-2]?\d):([0-5]\d)\s*(AM|PM|am|pm)?\b/,
-      /a\s+las\s+([0-2]?\d):([0-5]\d)/,
-    ];
-
-    for (const pattern of patterns) {
-      const match = text.match(pattern);
-      if (match) {
-        const hour = match[1];
-        const minute = match[2];
-        const meridiem = match[3] ?? '';
-        return `${hour}:${minute} ${meridiem}`.trim();
-      }
+    if (!text) {
+      return undefined;
+    }
+
+    const groups = (TIME_PATTERN.exec(text) ?? SPANISH_TIME_PATTERN.exec(text))?.groups;
+    if (!groups) {
+      return undefined;
     }
 
-    return undefined;
+    return `${groups['hour']}:${groups['minute']} ${groups['meridiem'] ?? ''}`.trim();
   }
 
   private extractMerchant(text: string): string | undefined {
-    const patterns = [
-      /en\s+([A-Z][A-Z\s]+?)(?:\s+con\s+)/,
-      /at\s+([A-Z][A-Z\s]+?)(?:\s|$)/,
-      /@\s*([A-Z][A-Z\s]+?)(?:\s|$)/,
-    ];
-
-    for (const pattern of patterns) {
-      const match = text.match(pattern);
-      if (match && match[1]) {
-        const merchant = match[1].trim().replace(/\s+/g, ' ');
-        return merchant;
-      }
+    if (!text) {
+      return undefined;
     }
 
-    return undefined;
+    const result = this.findHighestPriorityMatch(text, MERCHANT_PATTERN, MERCHANT_GROUP_NAMES);
+    if (!result) {
+      return undefined;
+    }
+
+    const groups = result.match.groups ?? {};
+    const merchant = groups['spanish'] ?? groups['english'] ?? groups['atSign'] ?? '';
+    return merchant.trim().replace(/\s+/g, ' ');
   }
 
   private extractCardInfo(text: string): CardInfo | undefined {
-    const patterns = [
-      /(T\.Cred|T\.Deb|Tarjeta)\s*\*(\d{4})/i,
-      /(Credit|Debit|Card)\s*\*(\d{4})/i,
-      /\*(\d{4})/,
-    ];
-
-    for (const pattern of patterns) {
-      const match = text.match(pattern);
-      if (match) {
-        if (match.length === 3 && match[1] && match[2]) {
-          let cardType: CardType;
-          const typeStr = match[1].toLowerCase();
-          if (typeStr.includes('cred') || typeStr === 'credit') {
-            cardType = CardType.CREDIT;
-          } else if (typeStr.includes('deb') || typeStr === 'debit') {
-            cardType = CardType.DEBIT;
-          } else {
-            cardType = CardType.UNKNOWN;
-          }
-          return CardInfo.create(cardType, match[2]);
-        } else if (match[1]) {
-          return CardInfo.create(CardType.UNKNOWN, match[1]);
-        }
-      }
+    if (!text) {
+      return undefined;
+    }
+
+    const result = this.findHighestPriorityMatch(text, CARD_INFO_PATTERN, CARD_INFO_GROUP_NAMES);
+    if (!result) {
+      return undefined;
     }
 
-    return undefined;
+    const groups = result.match.groups ?? {};
+    const last4 = groups['spanishLast4'] ?? groups['englishLast4'] ?? groups['last4'] ?? '';
+    const typeStr = (groups['spanishType'] ?? groups['englishType'])?.toLowerCase();
+
+    let cardType: CardType;
+    if (typeStr?.includes('cred')) {
+      cardType = CardType.CREDIT;
+    } else if (typeStr?.includes('deb')) {
+      cardType = CardType.DEBIT;
+    } else {
+      cardType = CardType.UNKNOWN;
+    }
+    return CardInfo.create(cardType, last4);
   }
 
   private extractReferenceNumbers(text: string): string[] {
+    if (!text) {
+      return [];
+    }
+
     const references: string[] = [];
-    const patterns = [
-      /(?:REF|REFERENCE|CONFIRMATION|TRANSACTION)\s*(?:NO|NUMBER|#)?:?\s*([A-Z0-9-]+)/gi,
-      /\b[A-Z]{2,}\d{6,}\b/g,
-    ];
 
-    for (const pattern of patterns) {
+    for (const pattern of REFERENCE_NUMBER_PATTERNS) {
       const matches = text.matchAll(pattern);
       for (const match of matches) {
         if (match[1]) {
@@ -275,10 +382,13 @@ export class ParseTransactionUseCase {
   }
 
   private extractAccountNumbers(text: string): string[] {
+    if (!text) {
+      return [];
+    }
+
     const accounts: string[] = [];
-    const patterns = [/\*{4,}(\d{4})/g, /(?:ACCOUNT|ACCT)\s*(?:NO|NUMBER|#)?:?\s*\**(\d{4})/gi];
 
-    for (const pattern of patterns) {
+    for (const pattern of ACCOUNT_NUMBER_PATTERNS) {
       const matches = text.matchAll(pattern);
       for (const match of matches) {
         if (match[1]) {
@@ -291,55 +401,62 @@ export class ParseTransactionUseCase {
   }
 
   private detectTransactionType(text: string): TransactionType {
-    const textLower = text.toLowerCase();
-
-    if (/compraste|compra|purchase/.test(textLower)) {
-      return TransactionType.PURCHASE;
-    } else if (/transferiste|transferencia|wire transfer|wire/.test(textLower)) {
-      return TransactionType.WIRE_TRANSFER;
-    } else if (/retiraste|retiro|withdrawal|withdraw|atm/.test(textLower)) {
-      return TransactionType.WITHDRAWAL;
-    } else if (/depositaste|depósito|deposit|deposited/.test(textLower)) {
-      return TransactionType.DEPOSIT;
-    } else if (/pagaste|pago|payment|paid/.test(textLower)) {
-      return TransactionType.PAYMENT;
-    } else if (/ach|electronic transfer/.test(textLower)) {
-      return TransactionType.ACH_TRANSFER;
+    if (!text) {
+      return TransactionType.UNKNOWN;
     }
 
-    return TransactionType.UNKNOWN;
+    const result = this.findHighestPriorityMatch(
+      text,
+      TRANSACTION_TYPE_PATTERN,
+      TRANSACTION_TYPE_GROUP_NAMES,
+    );
+    if (!result) {
+      return TransactionType.UNKNOWN;
+    }
+
+    return TRANSACTION_TYPE_GROUPS[result.rank]?.[1] ?? TransactionType.UNKNOWN;
+  }
+
+  // Scans the text once and returns the match of the highest-priority named group (lowest index
+  // in groupNames). This equals searching each group's pattern separately in order only if a
+  // match can never consume the start of a higher-priority match: either the alternatives cannot
+  // overlap, or the pattern is a zero-width lookahead tried at every position.
+  private findHighestPriorityMatch(
+    text: string,
+    pattern: RegExp,
+    groupNames: readonly string[],
+  ): { match: RegExpMatchArray; rank: number } | undefined {
+    let best: { match: RegExpMatchArray; rank: number } | undefined;
+
+    for (const match of text.matchAll(pattern)) {
+      const rank = groupNames.findIndex((groupName) => match.groups?.[groupName] !== undefined);
+      if (rank !== -1 && (!best || rank < best.rank)) {
+        best = { match, rank };
+        if (rank === 0) {
+          break;
+        }
+      }
+    }
+
+    return best;
   }
 
   private extractBankNames(text: string, logos: string[]): string[] {
     const banks = new Set<string>(logos);
+    if (!text) {
+      return Array.from(banks);
+    }
+
+    const mentioned = new Set<string>();
+    for (const match of text.matchAll(BANK_NAME_PATTERN)) {
+      const bank = BANKS_BY_LOWERCASE_NAME.get(match[1]?.toLowerCase() ?? '');
+      if (bank) {
+        mentioned.add(bank);
+      }
+    }
 
-    const commonBanks = [
-      'Bancolombia',
-      'Davivienda',
-      'BBVA Colombia',
-      'Banco de Bogotá',
-      'Banco de Occidente',
-      'Banco Popular',
-      'Banco AV Villas',
-      'Banco Caja Social',
-      'Bancoomeva',
-      'Colpatria',
-      'Itaú',
-      'Chase',
-      'Bank of America',
-      'Wells Fargo',
-      'Citibank',
-      'Capital One',
-      'US Bank',
-      'PNC',
-      'TD Bank',
-      'Truist',
-      'Fifth Third',
-      'Santander',
-    ];
-
-    for (const bank of commonBanks) {
-      if (text.toLowerCase().includes(bank.toLowerCase())) {
+    for (const bank of COMMON_BANKS) {
+      if (mentioned.has(bank)) {
         banks.add(bank);
       }
     }
@@ -0,0 +1,26 @@
+import { Amount } from './Amount.js';
+import { Currency } from '@shared/types/index.js';
+
+describe('Amount', () => {
+  describe('formatted', () => {
+    it.each([
+      [999.5, 'COP 999,50'],
+      [1000, 'COP 1.000,00'],
+      [1234567.89, 'COP 1.234.567,89'],
+    ])('formats COP %p as %p', (value, expected) => {
+      expect(Amount.create(value, Currency.COP).formatted).toBe(expected);
+    });
+
+    it.each([
+      [999.5, 'USD 999.50'],
+      [1000, 'USD 1,000.00'],
+      [1234567.89, 'USD 1,234,567.89'],
+    ])('formats USD %p as %p', (value, expected) => {
+      expect(Amount.create(value, Currency.USD).formatted).toBe(expected);
+    });
+
+    it('keeps an explicit formatted value', () => {
+      expect(Amount.create(1000, Currency.COP, '$1.000').formatted).toBe('$1.000');
+    });
+  });
+});
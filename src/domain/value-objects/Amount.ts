@@ -1,5 +1,25 @@
 import { Currency } from '@shared/types/index.js';
 
+const THOUSANDS_BOUNDARY = /\B(?=(\d{3})+(?!\d))/g;
+const SEPARATOR = /[.,]/g;
+const SWAPPED_SEPARATORS: Record<string, string> = { ',': '.', '.': ',' };
+
+function swapSeparator(separator: string): string {
+  return SWAPPED_SEPARATORS[separator] ?? separator;
+}
+
+// US format: comma for thousands, period for decimals
+function formatUsd(value: number): string {
+  return `USD ${value.toFixed(2).replace(THOUSANDS_BOUNDARY, ',')}`;
+}
+
+// Colombian format: period for thousands, comma for decimals (US grouping with the separators
+// swapped in a single pass)
+function formatCop(value: number): string {
+  const grouped = value.toFixed(2).replace(THOUSANDS_BOUNDARY, ',');
+  return `COP ${grouped.replace(SEPARATOR, swapSeparator)}`;
+}
+
 export class Amount {
   private constructor(
     public readonly value: number,
@@ -19,14 +39,9 @@ export class Amount {
   private static formatAmount(value: number, currency: Currency): string {
     switch (currency) {
       case Currency.COP:
-        // Colombian format: period for thousands, comma for decimals
-        return `COP ${value
-          .toFixed(2)
-          .replace(/\B(?=(\d{3})+(?!\d))/g, '.')
-          .replace('.', ',')}`;
+        return formatCop(value);
       case Currency.USD:
-        // US format: comma for thousands, period for decimals
-        return `USD ${value.toFixed(2).replace(/\B(?=(\d{3})+(?!\d))/g, ',')}`;
+        return formatUsd(value);
       default:
         return `${value.toFixed(2)}`;
     }
@@ -24,6 +24,7 @@ export const createExpressApp = (config: Config): Express => {
   );
 
   // Rate limiting
+  // Counts HTTP requests, so an imageUris batch (up to 16 Vision calls) counts as one
   const limiter = rateLimit({
     windowMs: config.RATE_LIMIT_WINDOW_MS,
     max: config.RATE_LIMIT_MAX_REQUESTS,
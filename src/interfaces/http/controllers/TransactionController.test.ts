@@ -0,0 +1,125 @@
+import 'reflect-metadata';
+import type { NextFunction, Request, Response } from 'express';
+import { TransactionController } from './TransactionController.js';
+import {
+  type AnnotateImageBatchItem,
+  type AnnotateImageUseCase,
+} from '@application/use-cases/AnnotateImageUseCase.js';
+import { ParseTransactionUseCase } from '@application/use-cases/ParseTransactionUseCase.js';
+import { OCRResult } from '@domain/entities/OCRResult.js';
+import { VisionFeature } from '@shared/types/index.js';
+import type { Logger } from 'winston';
+
+class FakeResponse {
+  public statusCode?: number;
+  public body?: unknown;
+
+  public status(code: number): this {
+    this.statusCode = code;
+    return this;
+  }
+
+  public json(body: unknown): this {
+    this.body = body;
+    return this;
+  }
+}
+
+const features = [VisionFeature.TEXT_DETECTION, VisionFeature.DOCUMENT_TEXT_DETECTION];
+
+describe('TransactionController', () => {
+  describe('annotate with imageUris', () => {
+    let infoLogs: Array<[string, Record<string, unknown>]>;
+    let logger: Logger;
+    let batchCalls: Array<[string[], VisionFeature[]]>;
+    let controller: TransactionController;
+    let response: FakeResponse;
+    let forwardedError: unknown;
+
+    const successfulItem = (imageUri: string): AnnotateImageBatchItem => {
+      const ocrResult = OCRResult.create({
+        imageUri,
+        features,
+        annotations: { textAnnotations: [{ description: 'Compraste $5.000 en TIENDA' }] },
+      });
+      return {
+        imageUri,
+        result: { ocrResult, ...new ParseTransactionUseCase(logger).execute(ocrResult) },
+      };
+    };
+
+    const annotate = (body: unknown): Promise<void> =>
+      controller.annotate(
+        { body, get: () => 'application/json' } as unknown as Request,
+        response as unknown as Response,
+        ((error?: unknown) => {
+          forwardedError = error;
+        }) as NextFunction,
+      );
+
+    beforeEach(() => {
+      infoLogs = [];
+      logger = {
+        info: (message: string, meta: Record<string, unknown>) => infoLogs.push([message, meta]),
+        error: () => undefined,
+      } as unknown as Logger;
+      batchCalls = [];
+      response = new FakeResponse();
+      forwardedError = undefined;
+
+      const annotateImageUseCase = {
+        executeFromUris: (imageUris: string[], requestedFeatures: VisionFeature[]) => {
+          batchCalls.push([imageUris, requestedFeatures]);
+          return Promise.resolve([
+            successfulItem('gs://bucket/transaction-1.jpg'),
+            { imageUri: 'gs://bucket/transaction-2.jpg', error: 'An unexpected error occurred' },
+          ]);
+        },
+      } as unknown as AnnotateImageUseCase;
+      controller = new TransactionController(annotateImageUseCase, logger);
+    });
+
+    it('responds with one result or error per image', async () => {
+      const imageUris = ['gs://bucket/transaction-1.jpg', 'gs://bucket/transaction-2.jpg'];
+
+      await annotate({ imageUris });
+
+      expect(batchCalls).toEqual([[imageUris, features]]);
+      expect(forwardedError).toBeUndefined();
+      expect(response.statusCode).toBe(200);
+      expect(response.body).toEqual({
+        results: [
+          {
+            imageUri: 'gs://bucket/transaction-1.jpg',
+            transaction: expect.objectContaining({ transactionType: 'PURCHASE' }),
+            validation: expect.objectContaining({ isValid: expect.any(Boolean) }),
+          },
+          { imageUri: 'gs://bucket/transaction-2.jpg', error: 'An unexpected error occurred' },
+        ],
+      });
+    });
+
+    it('logs the full OCR result of each successful image', async () => {
+      await annotate({ imageUris: ['gs://bucket/transaction-1.jpg'] });
+
+      const audited = infoLogs.filter(
+        ([message]) => message === 'Annotation completed successfully',
+      );
+      expect(audited).toHaveLength(1);
+      expect(audited[0]?.[1]['ocrResult']).toEqual(
+        expect.objectContaining({ imageUri: 'gs://bucket/transaction-1.jpg' }),
+      );
+    });
+
+    it('rejects imageUri combined with imageUris', async () => {
+      await annotate({
+        imageUri: 'gs://bucket/transaction.jpg',
+        imageUris: ['gs://bucket/transaction-1.jpg'],
+      });
+
+      expect(forwardedError).toBeInstanceOf(Error);
+      expect(batchCalls).toEqual([]);
+      expect(response.statusCode).toBeUndefined();
+    });
+  });
+});
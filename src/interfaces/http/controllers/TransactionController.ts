@@ -21,6 +21,43 @@ export class TransactionController {
 
       const validatedRequest = validateAnnotateRequest(req.body);
 
+      if (validatedRequest.imageUris) {
+        const items = await this.annotateImageUseCase.executeFromUris(
+          validatedRequest.imageUris,
+          validatedRequest.features,
+        );
+
+        // Log each complete OCR result for debugging and audit purposes, as for a single image
+        for (const { result } of items) {
+          if (result) {
+            this.logger.info('Annotation completed successfully', {
+              transactionId: result.transaction.id,
+              ocrResultId: result.ocrResult.id,
+              isValid: result.validation.isValid,
+              ocrResult: result.ocrResult.toJSON(),
+            });
+          }
+        }
+
+        this.logger.info('Batch annotation completed', {
+          imageCount: items.length,
+          failedCount: items.filter((item) => item.error !== undefined).length,
+        });
+
+        res.status(200).json({
+          results: items.map((item) =>
+            item.result
+              ? {
+                  imageUri: item.imageUri,
+                  transaction: item.result.transaction.toJSON(),
+                  validation: item.result.validation.toJSON(),
+                }
+              : { imageUri: item.imageUri, error: item.error },
+          ),
+        });
+        return;
+      }
+
       let result;
 
       if (validatedRequest.imageUri) {
@@ -35,7 +72,7 @@ export class TransactionController {
           validatedRequest.features,
         );
       } else {
-        throw new ValidationError('Either imageUri or imageBase64 must be provided');
+        throw new ValidationError('Either imageUri, imageUris or imageBase64 must be provided');
       }
 
       // Log the complete OCR result for debugging and audit purposes